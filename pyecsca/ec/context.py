@@ -243,8 +243,8 @@ current: Optional[Context] = None
 
 
 class _ContextManager:
-    def __init__(self, new_context):
-        self.new_context = deepcopy(new_context)
+    def __init__(self, new_context, copy: bool = True):
+        self.new_context = deepcopy(new_context) if copy else new_context
 
     def __enter__(self) -> Optional[Context]:
         global current
@@ -258,11 +258,12 @@ class _ContextManager:
 
 
 @public
-def local(ctx: Optional[Context] = None) -> ContextManager:
+def local(ctx: Optional[Context] = None, copy: bool = True) -> ContextManager:
     """
     Use a local context.
 
     :param ctx: If none, current context is copied.
+    :param copy: Whether to deep-copy the context, so the passed in one is left untouched.
     :return: A context manager.
     """
-    return _ContextManager(ctx)
+    return _ContextManager(ctx, copy)
@@ -12,6 +12,7 @@ from .error import raise_unsatisified_assumption
 from .mod import Mod
 from .model import CurveModel
 from .point import Point, InfinityPoint
+from .scalar import _scalar_bits
 from ..misc.cfg import getconfig
 
 
@@ -177,9 +178,9 @@ class EllipticCurve:
         q = copy(point)
         r = copy(point)
 
-        for i in range(scalar.bit_length() - 2, -1, -1):
+        for bit in _scalar_bits(scalar, scalar.bit_length() - 2):
             r = self.affine_double(r)
-            if scalar & (1 << i) != 0:
+            if bit != 0:
                 r = self.affine_add(r, q)
         return r
 
@@ -196,6 +196,10 @@ class Mod:
         """Whether this element is a quadratic residue (only implemented for prime modulus)."""
         raise NotImplementedError
 
+    def is_zero(self) -> bool:
+        """Whether this element is zero (cheaper than comparing to 0, which goes through rich comparison)."""
+        return self.x == 0
+
     def sqrt(self) -> "Mod":
         """
         Compute the modular square root of this element (only implemented for prime modulus).
@@ -268,17 +272,39 @@ class RawMod(Mod):
     def __new__(cls, *args, **kwargs):
         return object.__new__(cls)
 
-    def __init__(self, x: int, n: int):
-        self.x = x % n
+    def __init__(self, x: int, n: int, ensure: bool = True):
+        if ensure:
+            self.x = x % n
+        else:
+            self.x = x
         self.n = n
 
+    @_check
+    def __add__(self, other) -> "RawMod":
+        return RawMod((self.x + other.x) % self.n, self.n, ensure=False)
+
+    @_check
+    def __sub__(self, other) -> "RawMod":
+        return RawMod((self.x - other.x) % self.n, self.n, ensure=False)
+
+    def __neg__(self) -> "RawMod":
+        return RawMod(self.n - self.x if self.x else 0, self.n, ensure=False)
+
+    @_check
+    def __mul__(self, other) -> "RawMod":
+        return RawMod((self.x * other.x) % self.n, self.n, ensure=False)
+
     def inverse(self) -> "RawMod":
         if self.x == 0:
             raise_non_invertible()
-        x, _, d = extgcd(self.x, self.n)
-        if d != 1:
+        if self.x == 1:
+            return RawMod(1, self.n, ensure=False)
+        try:
+            res = pow(self.x, -1, self.n)
+        except ValueError:
             raise_non_invertible()
-        return RawMod(x, self.n)
+            res = 0
+        return RawMod(res, self.n, ensure=False)
 
     def is_residue(self):
         if not miller_rabin(self.n):
@@ -357,9 +383,9 @@ class RawMod(Mod):
         if n < 0:
             return self.inverse() ** (-n)
         if n == 1:
-            return RawMod(self.x, self.n)
+            return RawMod(self.x, self.n, ensure=False)
 
-        return RawMod(pow(self.x, n, self.n), self.n)
+        return RawMod(pow(self.x, n, self.n), self.n, ensure=False)
 
 
 _mod_classes["python"] = RawMod
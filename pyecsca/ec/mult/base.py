@@ -1,5 +1,4 @@
 from abc import ABC, abstractmethod
-from copy import copy
 from enum import Enum
 from public import public
 from typing import Mapping, Tuple, Optional, ClassVar, Set, Type
@@ -102,9 +101,9 @@ class ScalarMultiplier(ABC):
             raise NotImplementedError
         if self.short_circuit:
             if one == self._params.curve.neutral:
-                return copy(other)
+                return other.clone()
             if other == self._params.curve.neutral:
-                return copy(one)
+                return one.clone()
         return self.formulas["add"](
             self._params.curve.prime, one, other, **self._params.curve.parameters
         )[0]
@@ -116,7 +115,7 @@ class ScalarMultiplier(ABC):
                 self.short_circuit
                 and point == self._params.curve.neutral
         ):
-            return copy(point)
+            return point.clone()
         return self.formulas["dbl"](
             self._params.curve.prime, point, **self._params.curve.parameters
         )[0]
@@ -149,9 +148,9 @@ class ScalarMultiplier(ABC):
             raise NotImplementedError
         if self.short_circuit:
             if one == self._params.curve.neutral:
-                return copy(other)
+                return other.clone()
             if other == self._params.curve.neutral:
-                return copy(one)
+                return one.clone()
         return self.formulas["dadd"](
             self._params.curve.prime, start, one, other, **self._params.curve.parameters
         )[0]
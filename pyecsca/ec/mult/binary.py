@@ -12,6 +12,7 @@ from ..formula import (
     ScalingFormula,
 )
 from ..point import Point
+from ..scalar import _scalar_bits
 
 
 @public
@@ -66,9 +67,9 @@ class DoubleAndAddMultiplier(AccumulatorMultiplier, ScalarMultiplier, ABC):
             q = copy(self._point)
             r = copy(self._point)
             top = scalar.bit_length() - 2
-        for i in range(top, -1, -1):
+        for bit in _scalar_bits(scalar, top):
             r = self._dbl(r)
-            if scalar & (1 << i) != 0:
+            if bit != 0:
                 r = self._accumulate(r, q)
             elif self.always:
                 # dummy add
@@ -189,10 +190,10 @@ class CoronMultiplier(ScalarMultiplier):
                 return action.exit(copy(self._params.curve.neutral))
             q = self._point
             p0 = copy(q)
-            for i in range(scalar.bit_length() - 2, -1, -1):
+            for bit in _scalar_bits(scalar, scalar.bit_length() - 2):
                 p0 = self._dbl(p0)
                 p1 = self._add(p0, q)
-                if scalar & (1 << i) != 0:
+                if bit != 0:
                     p0 = p1
             if "scl" in self.formulas:
                 p0 = self._scl(p0)
@@ -0,0 +1,99 @@
+from copy import copy
+from math import ceil
+from typing import Optional, MutableMapping
+from public import public
+
+from ..params import DomainParameters
+from .base import ScalarMultiplier, AccumulationOrder, ScalarMultiplicationAction, PrecomputationAction, \
+    AccumulatorMultiplier
+from ..formula import (
+    AdditionFormula,
+    DoublingFormula,
+    ScalingFormula,
+)
+from ..point import Point
+from ..scalar import convert_base
+
+
+@public
+class CombMultiplier(AccumulatorMultiplier, ScalarMultiplier):
+    """
+    Fixed-base comb scalar multiplier, Algorithm 3.44 from [GECC]_.
+
+    Splits the scalar into :py:attr:`width` rows of d = ceil(bits / width) columns
+    and precomputes all 2^width - 1 row combinations in :py:meth:`init`, so that a
+    multiplication costs only d doublings and at most d additions.
+    """
+
+    requires = {AdditionFormula, DoublingFormula}
+    optionals = {ScalingFormula}
+    width: int
+    _points: MutableMapping[int, Point]
+
+    def __init__(
+            self,
+            add: AdditionFormula,
+            dbl: DoublingFormula,
+            width: int,
+            scl: Optional[ScalingFormula] = None,
+            accumulation_order: AccumulationOrder = AccumulationOrder.PeqPR,
+            short_circuit: bool = True,
+    ):
+        super().__init__(
+            short_circuit=short_circuit, accumulation_order=accumulation_order, add=add, dbl=dbl, scl=scl
+        )
+        if width < 1:
+            raise ValueError("Invalid width.")
+        self.width = width
+
+    def __hash__(self):
+        return id(self)
+
+    def __eq__(self, other):
+        if not isinstance(other, CombMultiplier):
+            return False
+        return self.formulas == other.formulas and self.short_circuit == other.short_circuit and self.width == other.width and self.accumulation_order == other.accumulation_order
+
+    def _columns(self) -> int:
+        return ceil(self._params.order.bit_length() / self.width)
+
+    def init(self, params: DomainParameters, point: Point):
+        with PrecomputationAction(params, point):
+            super().init(params, point)
+            d = self._columns()
+            base_points = {}
+            current_point = point
+            for i in range(self.width):
+                base_points[i] = current_point
+                if i != self.width - 1:
+                    for _ in range(d):
+                        current_point = self._dbl(current_point)
+            self._points = {}
+            for j in range(1, 2 ** self.width):
+                points = [base_points[i] for i in range(self.width) if j & (1 << i)]
+                accumulated = points[0]
+                for other in points[1:]:
+                    accumulated = self._accumulate(accumulated, other)
+                self._points[j] = accumulated
+
+    def multiply(self, scalar: int) -> Point:
+        if not self._initialized:
+            raise ValueError("ScalarMultiplier not initialized.")
+        with ScalarMultiplicationAction(self._point, scalar) as action:
+            if scalar == 0:
+                return action.exit(copy(self._params.curve.neutral))
+            d = self._columns()
+            recoded = convert_base(scalar, 2 ** d)
+            if len(recoded) < self.width:
+                recoded.extend([0] * (self.width - len(recoded)))
+            q = copy(self._params.curve.neutral)
+            for i in range(d - 1, -1, -1):
+                q = self._dbl(q)
+                word = 0
+                for j in range(self.width):
+                    word |= ((recoded[j] >> i) & 1) << j
+                if word:
+                    q = self._accumulate(q, self._points[word])
+            if "scl" in self.formulas:
+                q = self._scl(q)
+            return action.exit(q)
@@ -1,4 +1,3 @@
-from copy import copy
 from typing import Optional
 from public import public
 
@@ -11,6 +10,7 @@ from ..formula import (
     DifferentialAdditionFormula
 )
 from ..point import Point
+from ..scalar import _scalar_bits
 
 
 @public
@@ -47,18 +47,18 @@ class LadderMultiplier(ScalarMultiplier):
             raise ValueError("ScalarMultiplier not initialized.")
         with ScalarMultiplicationAction(self._point, scalar) as action:
             if scalar == 0:
-                return action.exit(copy(self._params.curve.neutral))
+                return action.exit(self._params.curve.neutral.clone())
             q = self._point
             if self.complete:
-                p0 = copy(self._params.curve.neutral)
+                p0 = self._params.curve.neutral.clone()
                 p1 = self._point
                 top = self._params.order.bit_length() - 1
             else:
-                p0 = copy(q)
+                p0 = q.clone()
                 p1 = self._dbl(q)
                 top = scalar.bit_length() - 2
-            for i in range(top, -1, -1):
-                if scalar & (1 << i) == 0:
+            for bit in _scalar_bits(scalar, top):
+                if bit == 0:
                     p0, p1 = self._ladd(q, p0, p1)
                 else:
                     p1, p0 = self._ladd(q, p1, p0)
@@ -99,15 +99,15 @@ class SimpleLadderMultiplier(ScalarMultiplier):
             raise ValueError("ScalarMultiplier not initialized.")
         with ScalarMultiplicationAction(self._point, scalar) as action:
             if scalar == 0:
-                return action.exit(copy(self._params.curve.neutral))
+                return action.exit(self._params.curve.neutral.clone())
             if self.complete:
                 top = self._params.order.bit_length() - 1
             else:
                 top = scalar.bit_length() - 1
-            p0 = copy(self._params.curve.neutral)
-            p1 = copy(self._point)
-            for i in range(top, -1, -1):
-                if scalar & (1 << i) == 0:
+            p0 = self._params.curve.neutral.clone()
+            p1 = self._point.clone()
+            for bit in _scalar_bits(scalar, top):
+                if bit == 0:
                     p1 = self._add(p0, p1)
                     p0 = self._dbl(p0)
                 else:
@@ -150,16 +150,16 @@ class DifferentialLadderMultiplier(ScalarMultiplier):
             raise ValueError("ScalarMultiplier not initialized.")
         with ScalarMultiplicationAction(self._point, scalar) as action:
             if scalar == 0:
-                return action.exit(copy(self._params.curve.neutral))
+                return action.exit(self._params.curve.neutral.clone())
             if self.complete:
                 top = self._params.order.bit_length() - 1
             else:
                 top = scalar.bit_length() - 1
             q = self._point
-            p0 = copy(self._params.curve.neutral)
-            p1 = copy(q)
-            for i in range(top, -1, -1):
-                if scalar & (1 << i) == 0:
+            p0 = self._params.curve.neutral.clone()
+            p1 = q.clone()
+            for bit in _scalar_bits(scalar, top):
+                if bit == 0:
                     p1 = self._dadd(q, p0, p1)
                     p0 = self._dbl(p0)
                 else:
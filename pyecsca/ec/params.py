@@ -5,6 +5,8 @@ It also provides a domain parameter class and a class for a whole category of do
 """
 import json
 import csv
+import pickle
+from functools import lru_cache
 from sympy import Poly, FF, symbols, sympify
 from astunparse import unparse
 from io import RawIOBase, BufferedIOBase
@@ -279,6 +281,15 @@ def load_category(
     else:
         raise TypeError
 
+    return _load_category(data, coords, infty)
+
+
+def _load_category(
+        data,
+        coords: Union[str, Callable[[str], str]],
+        infty: Union[bool, Callable[[str], bool]] = True,
+) -> DomainParameterCategory:
+    """Construct a category of domain parameters from parsed JSON data."""
     curves = []
     for curve_data in data["curves"]:
         curve_coords = coords(curve_data["name"]) if callable(coords) else coords
@@ -426,6 +437,52 @@ def load_params_ectester(
     return _create_params(curve_dict, coords, infty)
 
 
+@lru_cache(maxsize=None)
+def _get_categories():
+    """List the categories bundled in the std-curves database (cached)."""
+    return {
+        entry.name: entry for entry in files("pyecsca.ec").joinpath("std").iterdir() if entry.is_dir()
+    }
+
+
+@lru_cache(maxsize=None)
+def _get_category_json(category: str):
+    """
+    Load (and cache) the data of a category from the std-curves database.
+
+    Prefers a precompiled ``curves.pkl`` (see :py:func:`precompile_curves`)
+    over ``curves.json``, as unpickling the parsed data is much faster than
+    tokenizing the JSON.
+    """
+    categories = _get_categories()
+    if category not in categories:
+        raise ValueError(f"Category {category} not found.")
+    pkl = categories[category].joinpath("curves.pkl")
+    if pkl.is_file():
+        with pkl.open("rb") as f:
+            return pickle.load(f)
+    with categories[category].joinpath("curves.json").open("rb") as f:
+        return json.load(f)
+
+
+@public
+def precompile_curves() -> None:
+    """
+    Precompile the bundled std-curves JSON files into pickles.
+
+    Dumps the parsed data of each category into a ``curves.pkl`` next to
+    its ``curves.json``, which :py:func:`get_params` and
+    :py:func:`get_category` then load instead of re-parsing the JSON.
+    Intended to be run once at package-build or install time; requires the
+    package data directory to be writable.
+    """
+    for category in _get_categories().values():
+        with category.joinpath("curves.json").open("rb") as f:
+            data = json.load(f)
+        with category.joinpath("curves.pkl").open("wb") as f:  # type: ignore
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
 @public
 def get_category(
         category: str,
@@ -443,16 +500,11 @@ def get_category(
                   as argument the name of the curve and returns the infinity option to use for that curve.
     :return: The category.
     """
-    categories = {
-        entry.name: entry for entry in files("pyecsca.ec").joinpath("std").iterdir() if entry.is_dir()
-    }
-    if category not in categories:
-        raise ValueError(f"Category {category} not found.")
-    with categories[category].joinpath("curves.json").open("rb") as f:
-        return load_category(f, coords, infty)
+    return _load_category(_get_category_json(category), coords, infty)
 
 
 @public
+@lru_cache(maxsize=None)
 def get_params(
         category: str, name: str, coords: str, infty: bool = True
 ) -> DomainParameters:
@@ -461,6 +513,10 @@ def get_params(
 
     Uses the std-curves database at https://github.com/J08nY/std-curves.
 
+    .. note::
+        The results are cached, so repeated calls with the same arguments
+        return the same :py:class:`.DomainParameters` instance.
+
     :param category: The category of the curve.
     :param name: The name of the curve.
     :param coords: The name of the coordinate system to use.
@@ -468,13 +524,7 @@ def get_params(
                   point at infinity of the coordinate system.
     :return: The curve.
     """
-    categories = {
-        entry.name: entry for entry in files("pyecsca.ec").joinpath("std").iterdir() if entry.is_dir()
-    }
-    if category not in categories:
-        raise ValueError(f"Category {category} not found.")
-    with categories[category].joinpath("curves.json").open("rb") as f:
-        category_json = json.load(f)
+    category_json = _get_category_json(category)
     curve = None
     for curve in category_json["curves"]:
         if curve["name"] == name:
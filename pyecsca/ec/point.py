@@ -41,6 +41,7 @@ class Point:
     coordinate_model: CoordinateModel
     coords: Mapping[str, Mod]
     field: int
+    __slots__ = ("coordinate_model", "coords", "field", "_hash")
 
     def __init__(self, model: CoordinateModel, **coords: Mod):
         if not set(model.variables) == set(coords.keys()):
@@ -58,13 +59,30 @@ class Point:
                     )
         self.field = field if field is not None else 0
 
-    def __getattribute__(self, name):
+    def __getattr__(self, name):
         # Do the magic such that point.X1 works!
-        if "coords" in super().__getattribute__("__dict__"):
-            coords = super().__getattribute__("coords")
-            if name in coords:
-                return coords[name]
-        return super().__getattribute__(name)
+        # Only runs when regular attribute lookup fails, so ordinary
+        # attribute access does not pay for the indirection.
+        try:
+            coords = object.__getattribute__(self, "coords")
+        except AttributeError:
+            raise AttributeError(name)
+        if name in coords:
+            return coords[name]
+        raise AttributeError(name)
+
+    def clone(self) -> "Point":
+        """
+        Clone this point.
+
+        Cheaper than :py:func:`copy.copy` as it skips the copy-module
+        dispatch and the coordinate validation in :py:meth:`.__init__`.
+        """
+        new = object.__new__(self.__class__)
+        new.coordinate_model = self.coordinate_model
+        new.coords = dict(self.coords)
+        new.field = self.field
+        return new
 
     def to_affine(self) -> "Point":
         """Convert this point into the affine coordinate model, if possible."""
@@ -183,7 +201,14 @@ class Point:
         return self.coords == other.coords
 
     def __hash__(self):
-        return hash((self.coordinate_model, tuple(self.coords.keys()), tuple(self.coords.values())))
+        # Cached, as hashing the coordinates hashes their big-integer
+        # residues and contexts tracking points hash each point repeatedly.
+        try:
+            return self._hash
+        except AttributeError:
+            res = hash((self.coordinate_model, tuple(self.coords.keys()), tuple(self.coords.values())))
+            self._hash = res
+            return res
 
     def __str__(self):
         args = ", ".join([f"{key}={val}" for key, val in self.coords.items()])
@@ -197,6 +222,8 @@ class Point:
 class InfinityPoint(Point):
     """A point at infinity."""
 
+    __slots__ = ()
+
     def __init__(self, model: CoordinateModel):
         coords = {key: Undefined() for key in model.variables}
         super().__init__(model, **coords)
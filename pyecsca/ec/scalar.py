@@ -36,7 +36,7 @@ def sliding_window_ltr(i: int, w: int) -> List[int]:
     result: List[int] = []
     b = i.bit_length() - 1
     while b >= 0:
-        val = i & (1 << b)
+        val = (i >> b) & 1
         if not val:
             result.append(0)
             b -= 1
@@ -45,8 +45,7 @@ def sliding_window_ltr(i: int, w: int) -> List[int]:
             for v in range(1, w + 1):
                 if b + 1 < v:
                     break
-                mask = ((2**v) - 1) << (b - v + 1)
-                c = (i & mask) >> (b - v + 1)
+                c = (i >> (b - v + 1)) & ((1 << v) - 1)
                 if c & 1:
                     u = c
             k = u.bit_length()
@@ -68,13 +67,14 @@ def sliding_window_rtl(i: int, w: int) -> List[int]:
     :return: The sliding-window RTL form.
     """
     result: List[int] = []
+    mask = (1 << w) - 1
     while i >= 1:
         val = i & 1
         if not val:
             result = [0] + result
             i >>= 1
         else:
-            window = i & ((2**w) - 1)
+            window = i & mask
             result = ([0] * (w - 1)) + [window] + result
             i >>= w
 
@@ -131,3 +131,24 @@ def naf(k: int) -> List[int]:
     :return: The NAF.
     """
     return wnaf(k, 2)
+
+
+def _scalar_bits(scalar: int, top: int) -> bytes:
+    """
+    Precompute the bits of the scalar, from the :paramref:`~._scalar_bits.top` bit down to the lowest.
+
+    Walks the scalar with a single running right-shift instead of
+    constructing a fresh shifted bignum per bit, so the scalar
+    multiplication loops do no large-integer arithmetic at all.
+
+    :param scalar: The scalar.
+    :param top: The index of the highest bit to include (no bits if negative).
+    :return: The bits, most-significant first.
+    """
+    if top < 0:
+        return b""
+    bits = bytearray(top + 1)
+    for i in range(top, -1, -1):
+        bits[i] = scalar & 1
+        scalar >>= 1
+    return bytes(bits)
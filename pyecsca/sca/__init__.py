@@ -1,9 +1,25 @@
 """Package for Side-Channel Analysis."""
-
 from .re import *
 from .scope import *
 from .target import *
 from .trace import *
 from .trace_set import *
-from .stacked_traces import *
+from .stacked_traces import StackedTraces
 from .attack import *
+
+_TRACE_MANAGER_ATTRS = ("BaseTraceManager", "GPUTraceManager",
+                        "CPUTraceManager")
+
+# The trace managers are in __all__ (a star-import resolves them through
+# __getattr__ below), everything else is what the eager imports brought in.
+__all__ = [
+    name for name in dir() if not name.startswith("_")
+] + list(_TRACE_MANAGER_ATTRS)
+
+
+def __getattr__(name):
+    # Forwarded lazily to keep Numba out of the plain `import pyecsca.sca`.
+    if name in _TRACE_MANAGER_ATTRS:
+        from . import stacked_traces
+        return getattr(stacked_traces, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -30,16 +30,40 @@ from ...ec.context import Context, Action, local
 
 @public
 class MultipleContext(Context):
-    """Context that traces the multiples of points computed."""
+    """
+    Context that traces the multiples of points computed.
+
+    Also tracks (in :py:attr:`.has_zero_coord`) whether any of the computed
+    points had a zero X or Y coordinate, i.e. was an [RPA]_ point. The flag
+    is updated as the points are recorded, so querying it is constant-time,
+    unlike a scan over :py:attr:`.points`.
+    """
 
     base: Optional[Point]
     points: MutableMapping[Point, int]
     inside: bool
+    has_zero_coord: bool
 
     def __init__(self):
         self.base = None
         self.points = {}
         self.inside = False
+        self.has_zero_coord = False
+
+    def _record(self, point: Point, multiple: int) -> None:
+        self.points[point] = multiple
+        if not self.has_zero_coord:
+            for name, value in point.coords.items():
+                if name in ("X", "Y", "x", "y") and value.is_zero():
+                    self.has_zero_coord = True
+                    break
+
+    def reset(self) -> None:
+        """Reset the context to its initial state, so it can be reused for an unrelated computation."""
+        self.base = None
+        self.points = {}
+        self.inside = False
+        self.has_zero_coord = False
 
     def enter_action(self, action: Action) -> None:
         if isinstance(action, (ScalarMultiplicationAction, PrecomputationAction)):
@@ -48,10 +72,12 @@ class MultipleContext(Context):
                 if self.base != action.point:
                     # If we are not building on top of it we have to forget stuff and set a new base and mapping.
                     self.base = action.point
-                    self.points = {self.base: 1}
+                    self.points = {}
+                    self.has_zero_coord = False
+                    self._record(self.base, 1)
             else:
                 self.base = action.point
-                self.points = {self.base: 1}
+                self._record(self.base, 1)
             self.inside = True
 
     def exit_action(self, action: Action) -> None:
@@ -61,28 +87,28 @@ class MultipleContext(Context):
             if isinstance(action.formula, DoublingFormula):
                 inp = action.input_points[0]
                 out = action.output_points[0]
-                self.points[out] = 2 * self.points[inp]
+                self._record(out, 2 * self.points[inp])
             elif isinstance(action.formula, TriplingFormula):
                 inp = action.input_points[0]
                 out = action.output_points[0]
-                self.points[out] = 3 * self.points[inp]
+                self._record(out, 3 * self.points[inp])
             elif isinstance(action.formula, AdditionFormula):
                 one, other = action.input_points
                 out = action.output_points[0]
-                self.points[out] = self.points[one] + self.points[other]
+                self._record(out, self.points[one] + self.points[other])
             elif isinstance(action.formula, NegationFormula):
                 inp = action.input_points[0]
                 out = action.output_points[0]
-                self.points[out] = -self.points[inp]
+                self._record(out, -self.points[inp])
             elif isinstance(action.formula, DifferentialAdditionFormula):
                 _, one, other = action.input_points
                 out = action.output_points[0]
-                self.points[out] = self.points[one] + self.points[other]
+                self._record(out, self.points[one] + self.points[other])
             elif isinstance(action.formula, LadderFormula):
                 _, one, other = action.input_points
                 dbl, add = action.output_points
-                self.points[add] = self.points[one] + self.points[other]
-                self.points[dbl] = 2 * self.points[one]
+                self._record(add, self.points[one] + self.points[other])
+                self._record(dbl, 2 * self.points[one])
 
     def __repr__(self):
         return f"{self.__class__.__name__}({self.base!r}, multiples={self.points.values()!r})"
@@ -149,8 +175,11 @@ def rpa_distinguish(params: DomainParameters, mults: List[ScalarMultiplier], ora
         print([mult.__class__.__name__ for mult in mults])
         mults_to_multiples = {}
         counts: Counter = Counter()
+        # One context reused for the whole sweep, instead of a fresh allocation per multiplier.
+        ctx = MultipleContext()
         for mult in mults:
-            with local(MultipleContext()) as ctx:
+            ctx.reset()
+            with local(ctx, copy=False):
                 mult.init(params, params.generator)
                 mult.multiply(scalar)
             multiples = set(ctx.points.values())
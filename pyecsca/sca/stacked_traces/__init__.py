@@ -1,2 +1,16 @@
 from .stacked_traces import *
-from .combine import *
+from .stacked_traces import __all__ as _stacked_all
+
+_COMBINE_ATTRS = ("BaseTraceManager", "GPUTraceManager", "CPUTraceManager")
+
+__all__ = list(_stacked_all) + list(_COMBINE_ATTRS)
+
+
+def __getattr__(name):
+    # The trace managers are imported on first access (PEP 562), so that
+    # importing this package does not pull in Numba, which is slow to
+    # import and touches the CUDA driver.
+    if name in _COMBINE_ATTRS:
+        from . import combine
+        return getattr(combine, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,7 +7,7 @@ import numpy.typing as npt
 from math import sqrt
 
 from public import public
-from typing import Callable, Union, Tuple, Optional, cast, List
+from typing import Callable, Dict, Union, Tuple, Optional, cast, List
 
 from ...sca.trace.trace import CombinedTrace
 from ...sca.stacked_traces import StackedTraces
@@ -92,6 +92,8 @@ InputType = Union[npt.NDArray[np.number], npt.ArrayLike]
 
 CHUNK_MEMORY_RATIO = 0.4
 STREAM_COUNT = 4
+WARP_SIZE = 32
+_PRECISIONS = {"fp32": np.float32, "fp64": np.float64}
 
 
 @public
@@ -101,6 +103,11 @@ class GPUTraceManager(BaseTraceManager):
     _tpb: TPB
     _chunk_size: Optional[int]
     _stream_count: Optional[int]
+    _col_sum: Optional[devicearray.DeviceNDArray]
+    _col_sqsum: Optional[devicearray.DeviceNDArray]
+    _samples_global: Optional[devicearray.DeviceNDArray]
+    _pinned_samples: Optional[npt.NDArray[np.number]]
+    _output_buffers: Dict[Tuple, List[devicearray.DeviceNDArray]]
 
     def __init__(self,
                  traces: StackedTraces,
@@ -108,7 +115,8 @@ class GPUTraceManager(BaseTraceManager):
                  chunk: bool = False,
                  chunk_size: Optional[int] = None,
                  chunk_memory_ratio: Optional[float] = None,
-                 stream_count: Optional[int] = None) -> None:
+                 stream_count: Optional[int] = None,
+                 precision: str = "fp32") -> None:
         """
         :param traces: Stacked traces on which to operate.
         :param tpb: Threads per block to use for GPU operations.
@@ -117,10 +125,18 @@ class GPUTraceManager(BaseTraceManager):
                            Chunks will be `chunk_size` x `trace_count`.
         :param chunk_memory_ratio: Part of available memory to use for chunking.
         :param stream_count: Number of streams to use for chunking.
+        :param precision: Floating-point width to store the samples in on
+                          the GPU, either "fp32" (the default, half the
+                          memory traffic of fp64) or "fp64".
         """
         self._check_init_args(chunk_size,
                               chunk_memory_ratio,
                               tpb)
+        if precision not in _PRECISIONS:
+            raise ValueError(
+                f"Unknown precision {precision}, "
+                f"expected one of {tuple(_PRECISIONS)}"
+            )
 
         chunk = (chunk
                  or stream_count is not None
@@ -128,12 +144,21 @@ class GPUTraceManager(BaseTraceManager):
                  or chunk_memory_ratio is not None)
 
         super().__init__(traces)
-        # If chunking is used, the samples are stored in Fortran order
-        # for contiguous memory access
-        if chunk:
-            self._traces.samples = np.asfortranarray(self._traces.samples)
+        # The samples are stored in Fortran order so that a warp of threads
+        # (adjacent columns) reads contiguous memory in the column-wise
+        # kernels, and chunking slices are contiguous. The kernels are
+        # bandwidth-bound, so narrowing the samples to fp32 (the default)
+        # nearly halves their runtime; accumulation stays in fp64.
+        self._traces.samples = np.asfortranarray(
+            self._traces.samples, dtype=_PRECISIONS[precision])
 
         self._tpb = tpb
+        self._col_sum = None
+        self._col_sqsum = None
+        self._samples_global = None
+        self._pinned_samples = None
+        self._output_buffers = {}
+        self._stream = cuda.stream()
         if not chunk:
             self._combine_func = self._gpu_combine1D_all
             self._chunk_size = None
@@ -228,6 +253,99 @@ class GPUTraceManager(BaseTraceManager):
     def traces_shape(self) -> Tuple[int, ...]:
         return self._traces.samples.shape
 
+    @property
+    def chunked(self) -> bool:
+        return self._chunk_size is not None
+
+    @property
+    def stream(self) -> cuda.cudadrv.driver.Stream:
+        """The stream the non-chunked operations are issued on."""
+        return self._stream
+
+    def _upload_samples(self) -> devicearray.DeviceNDArray:
+        """
+        Upload the samples to the GPU asynchronously from a pinned staging buffer.
+
+        Pinned memory transfers at near-peak PCIe bandwidth and the
+        asynchronous copy overlaps with the following allocations and
+        kernel launch on the manager's stream. The device copy is cached,
+        so the manager pays for the transfer only once no matter how many
+        statistics are computed over the traces.
+        """
+        if self._samples_global is not None:
+            return self._samples_global
+        pinned_samples = cuda.pinned_array(self._traces.samples.shape,
+                                           dtype=self._traces.samples.dtype,
+                                           order="F")
+        np.copyto(pinned_samples, self._traces.samples)
+        # The staging buffer must stay referenced until the asynchronous
+        # copy completes, so it is kept on the manager (and dropped in
+        # free_samples()).
+        self._pinned_samples = pinned_samples
+        self._samples_global = cuda.to_device(pinned_samples,
+                                              stream=self._stream)
+        return self._samples_global
+
+    def free_samples(self) -> None:
+        """Drop the cached device copy of the samples (and moments), freeing GPU memory."""
+        self._samples_global = None
+        self._pinned_samples = None
+        self._col_sum = None
+        self._col_sqsum = None
+        self._output_buffers = {}
+
+    def _device_outputs(self, shape: Union[int, Tuple[int, ...]],
+                        count: int = 1) -> List[devicearray.DeviceNDArray]:
+        """
+        Return :paramref:`~._device_outputs.count` device output buffers of the given shape.
+
+        The kernels overwrite every element of their outputs, so the
+        buffers are cached and reused across calls instead of being
+        allocated anew, which avoids repeated device allocations during
+        correlation sweeps.
+
+        :param shape: Shape of each output buffer.
+        :param count: Number of buffers.
+        :return: The output buffers.
+        """
+        key = (shape, count)
+        buffers = self._output_buffers.get(key)
+        if buffers is None:
+            buffers = [
+                cuda.device_array(shape,
+                                  dtype=self._traces.samples.dtype,
+                                  stream=self._stream)
+                for _ in range(count)
+            ]
+            self._output_buffers[key] = buffers
+        return buffers
+
+    def precompute_moments(self) -> None:
+        """
+        Precompute the per-sample sums and sums of squares and cache them on-device.
+
+        The cached moments let subsequent statistic computations
+        (:py:meth:`.average`, :py:meth:`.variance`, :py:meth:`.standard_deviation`)
+        and Pearson-correlation kernels skip re-reading the whole samples matrix.
+        """
+        if self.chunked:
+            raise ValueError("Moment caching is not supported "
+                             "with chunked processing")
+        if not isinstance(self._tpb, int):
+            raise ValueError("Something went wrong. "
+                             "TPB should be an int")
+        samples_input = self._upload_samples()
+        sample_count = self._traces.samples.shape[1]
+        col_sum = cuda.device_array(sample_count, stream=self._stream)
+        col_sqsum = cuda.device_array(sample_count, stream=self._stream)
+        bpg = (sample_count + self._tpb - 1) // self._tpb
+        gpu_moments[bpg, self._tpb, self._stream](samples_input,
+                                                  col_sum,
+                                                  col_sqsum)
+        self._stream.synchronize()
+        self._col_sum = col_sum
+        self._col_sqsum = col_sqsum
+
     def _gpu_combine1D(self,
                        func,
                        inputs: Optional[List[InputType]] = None,
@@ -265,22 +383,44 @@ class GPUTraceManager(BaseTraceManager):
             raise ValueError("Something went wrong. "
                              "TPB should be an int")
 
-        samples_input = cuda.to_device(self._traces.samples)
+        samples_input = self._upload_samples()
         device_inputs = [
-            cuda.to_device(inp)  # type: ignore
+            inp if cuda.is_cuda_array(inp) or isinstance(inp, (int, float))
+            else cuda.to_device(inp, stream=self._stream)  # type: ignore
             for inp in inputs
         ]
-        device_outputs = [
-            cuda.device_array(self._traces.samples.shape[1])
-            for _ in range(output_count)
-        ]
+        device_outputs = self._device_outputs(
+            self._traces.samples.shape[1], output_count)
 
         bpg = (self._traces.samples.shape[1] + self._tpb - 1) // self._tpb
-        func[bpg, self._tpb](samples_input,
-                             *device_inputs,
-                             *device_outputs)
-        return [device_output.copy_to_host()
-                for device_output in device_outputs]
+        assert bpg * self._tpb >= self._traces.samples.shape[1]
+        func[bpg, self._tpb, self._stream](samples_input,
+                                           *device_inputs,
+                                           *device_outputs)
+        results = [device_output.copy_to_host(stream=self._stream)
+                   for device_output in device_outputs]
+        self._stream.synchronize()
+        return results
+
+    def _gpu_combine1D_warp(self, func) -> CombinedTrace:
+        """
+        Runs a warp-cooperative combination function, one block per column.
+
+        Each column is reduced by a full warp striding over the rows, so
+        adjacent lanes read adjacent rows, which are contiguous in the
+        column-major samples layout.
+
+        :param func: Function to run.
+        :return: Combined trace output from the GPU function.
+        """
+        samples_input = self._upload_samples()
+        sample_count = self._traces.samples.shape[1]
+        device_output, = self._device_outputs(sample_count)
+        func[sample_count, WARP_SIZE, self._stream](samples_input,
+                                                    device_output)
+        result = device_output.copy_to_host(stream=self._stream)
+        self._stream.synchronize()
+        return CombinedTrace(result, self._traces.meta)
 
     def _gpu_combine1D_chunked(self,
                                func,
@@ -314,7 +454,8 @@ class GPUTraceManager(BaseTraceManager):
         ]
 
         device_inputs = [
-            cuda.const.array_like(inp)  # type: ignore
+            inp if isinstance(inp, (int, float))
+            else cuda.const.array_like(inp)  # type: ignore
             for inp in inputs
         ]
 
@@ -345,6 +486,7 @@ class GPUTraceManager(BaseTraceManager):
                 ]
 
                 bpg = (end - start + self._tpb - 1) // self._tpb
+                assert bpg * self._tpb >= end - start
                 func[bpg, self._tpb, stream](device_input,
                                              *device_inputs,
                                              *device_outputs)
@@ -363,7 +505,20 @@ class GPUTraceManager(BaseTraceManager):
 
         return [np.concatenate(chunk_result) for chunk_result in chunk_results]
 
+    def _moment_stats(self) -> Tuple[npt.NDArray[np.number],
+                                     npt.NDArray[np.number]]:
+        """Compute the sample averages and variances from the cached moments."""
+        assert self._col_sum is not None and self._col_sqsum is not None
+        trace_count = self._traces.samples.shape[0]
+        averages = self._col_sum.copy_to_host() / trace_count
+        variances = (self._col_sqsum.copy_to_host() / trace_count
+                     - np.square(averages))
+        return averages, variances
+
     def average(self) -> CombinedTrace:
+        if self._col_sum is not None:
+            averages, _ = self._moment_stats()
+            return CombinedTrace(averages, self._traces.meta)
         return cast(CombinedTrace, self._gpu_combine1D(gpu_average))
 
     def conditional_average(self,
@@ -372,17 +527,29 @@ class GPUTraceManager(BaseTraceManager):
         raise NotImplementedError()
 
     def standard_deviation(self) -> CombinedTrace:
+        if self._col_sum is not None:
+            _, variances = self._moment_stats()
+            return CombinedTrace(np.sqrt(variances), self._traces.meta)
         return cast(CombinedTrace, self._gpu_combine1D(gpu_std_dev))
 
     def variance(self) -> CombinedTrace:
+        if self._col_sum is not None:
+            _, variances = self._moment_stats()
+            return CombinedTrace(variances, self._traces.meta)
         return cast(CombinedTrace, self._gpu_combine1D(gpu_variance))
 
     def average_and_variance(self) -> List[CombinedTrace]:
+        if self._col_sum is not None:
+            averages, variances = self._moment_stats()
+            return [CombinedTrace(averages, self._traces.meta),
+                    CombinedTrace(variances, self._traces.meta)]
         averages, variances = self._gpu_combine1D(gpu_avg_var, output_count=2)
         return [averages, variances]
 
     def add(self) -> CombinedTrace:
-        return cast(CombinedTrace, self._gpu_combine1D(gpu_add))
+        if self.chunked:
+            return cast(CombinedTrace, self._gpu_combine1D(gpu_add))
+        return self._gpu_combine1D_warp(gpu_add_warp)
 
     def run(self,
             func: Callable,
@@ -391,6 +558,51 @@ class GPUTraceManager(BaseTraceManager):
             -> Union[CombinedTrace, List[CombinedTrace]]:
         return self._gpu_combine1D(func, inputs, output_count)
 
+    def run_batched(self,
+                    func: Callable,
+                    inputs: List[InputType],
+                    batch_count: int) -> List[CombinedTrace]:
+        """
+        Run a batched combination function on the samples column-wise.
+
+        The function is launched on a 2D grid, one row of blocks per batch
+        entry, and writes a `batch_count` x `sample_count` output matrix.
+        The samples are read from global memory once for the whole batch.
+
+        :param func: Function to run.
+        :param inputs: Additional inputs for the GPU function.
+        :param batch_count: Number of batch entries (output rows).
+        :return: Combined trace for each batch entry.
+        """
+        if self.chunked:
+            raise ValueError("Batched runs are not supported "
+                             "with chunked processing")
+        if not isinstance(self._tpb, int):
+            raise ValueError("Something went wrong. "
+                             "TPB should be an int")
+
+        samples_input = self._upload_samples()
+        device_inputs = [
+            inp if cuda.is_cuda_array(inp) or isinstance(inp, (int, float))
+            else cuda.to_device(inp, stream=self._stream)  # type: ignore
+            for inp in inputs
+        ]
+        sample_count = self._traces.samples.shape[1]
+        device_output, = self._device_outputs((batch_count, sample_count))
+
+        bpg = ((sample_count + self._tpb - 1) // self._tpb, batch_count)
+        assert bpg[0] * self._tpb >= sample_count
+        func[bpg, (self._tpb, 1), self._stream](samples_input,
+                                                *device_inputs,
+                                                device_output)
+        results = device_output.copy_to_host(stream=self._stream)
+        self._stream.synchronize()
+        return [
+            CombinedTrace(result, self._traces.meta)
+            for result
+            in results
+        ]
+
 
 @cuda.jit(device=True, cache=True)
 def _gpu_average(col: int, samples: npt.NDArray[np.number],
@@ -426,37 +638,30 @@ def gpu_average(samples: npt.NDArray[np.number],
 
 
 @cuda.jit(device=True, cache=True)
-def _gpu_var_from_avg(col: int,
-                      samples: npt.NDArray[np.number],
-                      averages: npt.NDArray[np.number],
-                      result: npt.NDArray[np.number]):
+def _gpu_avg_var(col: int, samples: npt.NDArray[np.number],
+                 result_avg: npt.NDArray[np.number],
+                 result_var: npt.NDArray[np.number]):
     """
-    Cuda device thread function computing the variance from the average of a sample of stacked traces.
-
-    :param col: Index of the sample.
-    :param samples: Shared array of the samples of stacked traces.
-    :param averages: Array of averages of samples.
-    :param result: Result output array.
-    """
-    var = 0.
-    for row in range(samples.shape[0]):
-        current = samples[row, col] - averages[col]
-        var += current * current
-    result[col] = var / samples.shape[0]
+    Cuda device thread function computing the average and variance of a sample of stacked traces.
 
-
-@cuda.jit(device=True, cache=True)
-def _gpu_variance(col: int, samples: npt.NDArray[np.number],
-                  result: npt.NDArray[np.number]):
-    """
-    Cuda device thread function computing the variance of a sample of stacked traces.
+    Uses the numerically-stable Welford recurrence, so both results are
+    produced in a single pass over the samples. The output arrays may alias
+    if only the variance is of interest.
 
     :param col: Index of the sample.
     :param samples: Shared array of the samples of stacked traces.
-    :param result: Result output array.
+    :param result_avg: Result average output array.
+    :param result_var: Result variance output array.
     """
-    _gpu_average(col, samples, result)
-    _gpu_var_from_avg(col, samples, result, result)
+    mean = 0.
+    m2 = 0.
+    for row in range(samples.shape[0]):
+        current = samples[row, col]
+        delta = current - mean
+        mean += delta / (row + 1)
+        m2 += delta * (current - mean)
+    result_avg[col] = mean
+    result_var[col] = m2 / samples.shape[0]
 
 
 @cuda.jit(cache=True)
@@ -473,7 +678,7 @@ def gpu_std_dev(samples: npt.NDArray[np.number],
     if col >= samples.shape[1]:
         return
 
-    _gpu_variance(col, samples, result)
+    _gpu_avg_var(col, samples, result, result)
 
     result[col] = sqrt(result[col])
 
@@ -492,7 +697,7 @@ def gpu_variance(samples: npt.NDArray[np.number],
     if col >= samples.shape[1]:
         return
 
-    _gpu_variance(col, samples, result)
+    _gpu_avg_var(col, samples, result, result)
 
 
 @cuda.jit(cache=True)
@@ -511,8 +716,33 @@ def gpu_avg_var(samples: npt.NDArray[np.number],
     if col >= samples.shape[1]:
         return
 
-    _gpu_average(col, samples, result_avg)
-    _gpu_var_from_avg(col, samples, result_avg, result_var)
+    _gpu_avg_var(col, samples, result_avg, result_var)
+
+
+@cuda.jit(cache=True)
+def gpu_moments(samples: npt.NDArray[np.number],
+                result_sum: npt.NDArray[np.number],
+                result_sqsum: npt.NDArray[np.number]):
+    """
+    Sum and sum of squares of stacked traces, sample-wise.
+
+    :param samples: Stacked traces' samples.
+    :param result_sum: Result sum output array.
+    :param result_sqsum: Result sum-of-squares output array.
+    """
+    col = cuda.grid(1)  # type: ignore
+
+    if col >= samples.shape[1]:
+        return
+
+    acc_sum = 0.
+    acc_sqsum = 0.
+    for row in range(samples.shape[0]):
+        current = samples[row, col]
+        acc_sum += current
+        acc_sqsum += current * current
+    result_sum[col] = acc_sum
+    result_sqsum[col] = acc_sqsum
 
 
 @cuda.jit(cache=True)
@@ -535,6 +765,38 @@ def gpu_add(samples: npt.NDArray[np.number],
     result[col] = res
 
 
+@cuda.jit(cache=True)
+def gpu_add_warp(samples: npt.NDArray[np.number],
+                 result: npt.NDArray[np.number]):
+    """
+    Add samples of stacked traces, sample-wise, one warp per sample.
+
+    Launched with one block of :py:data:`WARP_SIZE` threads per column.
+    The lanes stride over the rows (contiguous in the column-major
+    layout) and combine their partial sums with warp shuffles.
+
+    :param samples: Stacked traces' samples.
+    :param result: Result output array.
+    """
+    col = cuda.blockIdx.x  # type: ignore
+    lane = cuda.threadIdx.x  # type: ignore
+
+    if col >= samples.shape[1]:
+        return
+
+    acc = 0.
+    for row in range(lane, samples.shape[0], WARP_SIZE):
+        acc += samples[row, col]
+
+    offset = WARP_SIZE // 2
+    while offset > 0:
+        acc += cuda.shfl_down_sync(0xffffffff, acc, offset)  # type: ignore
+        offset //= 2
+
+    if lane == 0:
+        result[col] = acc
+
+
 @public
 class CPUTraceManager:
     """Manager for operations on stacked traces on CPU."""
@@ -1,6 +1,6 @@
 import numpy as np
 import numpy.typing as npt
-from numba import cuda
+from numba import cuda, float64
 from numba.cuda.cudadrv.devicearray import DeviceNDArray
 from math import sqrt
 from typing import List, Optional, Union
@@ -8,6 +8,9 @@ from .combine import InputType, GPUTraceManager
 from .stacked_traces import StackedTraces
 from ..trace.trace import CombinedTrace
 
+TPB_ROWS = 128
+"""Row-tile height used to stage intermediate values in shared memory."""
+
 
 def gpu_pearson_corr(intermediate_values: npt.NDArray[np.number],
                      stacked_traces: Optional[StackedTraces] = None,
@@ -20,17 +23,36 @@ def gpu_pearson_corr(intermediate_values: npt.NDArray[np.number],
         assert stacked_traces is not None
         trace_manager = GPUTraceManager(stacked_traces, **tm_kwargs)
 
-    if (len(intermediate_values.shape) != 1
-        or (intermediate_values.shape[0]
+    if (len(intermediate_values.shape) not in (1, 2)
+        or (intermediate_values.shape[-1]
             != trace_manager.traces_shape[0])):
         raise ValueError("Intermediate values have to be a vector "
-                         "as long as trace_count")
+                         "(or a batch of vectors) as long as trace_count")
+
+    if len(intermediate_values.shape) == 2:
+        return _gpu_pearson_corr_batch(intermediate_values, trace_manager)
 
-    intermed_sum: np.number = np.sum(intermediate_values)
-    intermed_sq_sum: np.number = np.sum(np.square(intermediate_values))
+    # The dot product fuses square and sum without a temporary array and
+    # the plain floats are passed as kernel scalars, skipping two
+    # one-element device uploads.
+    intermed_sum = float(intermediate_values.sum())
+    intermed_sq_sum = float(intermediate_values @ intermediate_values)
     inputs: List[InputType] = [intermediate_values,
-                               np.array([intermed_sum]),
-                               np.array([intermed_sq_sum])]
+                               intermed_sum,
+                               intermed_sq_sum]
+
+    if trace_manager.chunked:
+        return trace_manager.run(
+            _gpu_pearson_corr_chunked,
+            inputs
+        )
+
+    # Cached per-sample moments replace the sum accumulation in the kernel,
+    # so repeated calls with different intermediate values only stream
+    # the samples once for the products.
+    if trace_manager._col_sum is None:
+        trace_manager.precompute_moments()
+    inputs.extend([trace_manager._col_sum, trace_manager._col_sqsum])
 
     return trace_manager.run(
         _gpu_pearson_corr,
@@ -38,43 +60,231 @@ def gpu_pearson_corr(intermediate_values: npt.NDArray[np.number],
     )
 
 
+def _gpu_pearson_corr_batch(intermediate_values: npt.NDArray[np.number],
+                            trace_manager: GPUTraceManager) \
+        -> List[CombinedTrace]:
+    """
+    Correlate a batch of intermediate-value hypotheses in one kernel launch.
+
+    The samples matrix is streamed once for all hypotheses instead of once
+    per hypothesis.
+    """
+    if trace_manager.chunked:
+        # No batched kernel for chunked processing, correlate one
+        # hypothesis at a time.
+        return [
+            gpu_pearson_corr(iv, trace_manager=trace_manager)  # type: ignore
+            for iv in intermediate_values
+        ]
+
+    intermed_sums = np.sum(intermediate_values, axis=1)
+    intermed_sq_sums = np.einsum("ij,ij->i",
+                                 intermediate_values,
+                                 intermediate_values)
+
+    if trace_manager._col_sum is None:
+        trace_manager.precompute_moments()
+    inputs: List[InputType] = [intermediate_values,
+                               intermed_sums,
+                               intermed_sq_sums,
+                               trace_manager._col_sum,
+                               trace_manager._col_sqsum]
+
+    return trace_manager.run_batched(
+        _gpu_pearson_corr_batched,
+        inputs,
+        intermediate_values.shape[0]
+    )
+
+
 @cuda.jit(cache=True)
 def _gpu_pearson_corr(samples: DeviceNDArray,
                       intermediate_values: DeviceNDArray,
-                      intermed_sum: DeviceNDArray,
-                      intermed_sq_sum: DeviceNDArray,
+                      intermed_sum: float,
+                      intermed_sq_sum: float,
+                      col_sum: DeviceNDArray,
+                      col_sqsum: DeviceNDArray,
                       result: DeviceNDArray):
     """
     Calculates the Pearson correlation coefficient between the given samples and intermediate values using GPU acceleration.
 
+    Uses precomputed per-sample moments (see :py:meth:`.GPUTraceManager.precompute_moments`),
+    so the only accumulation over the samples is the sample-intermediate product.
+    The intermediate values are staged into shared memory in tiles of
+    :py:data:`TPB_ROWS` rows, so each block reads them from global memory
+    only once instead of once per column.
+
     :param samples: A 2D array of shape (n, m) containing the samples.
     :type samples: npt.NDArray[np.number]
     :param intermediate_values: A 1D array of shape (n,) containing the intermediate values.
     :type intermediate_values: npt.NDArray[np.number]
-    :param intermed_sum: A 1D array of shape (1,) containing the precomputed sum of the intermediate values.
-    :type intermed_sum: npt.NDArray[np.number]
-    :param intermed_sq_sum: A 1D array of shape (1,) containing the precomputed sum of the squares of the intermediate values.
+    :param intermed_sum: The precomputed sum of the intermediate values.
+    :param intermed_sq_sum: The precomputed sum of the squares of the intermediate values.
+    :param col_sum: A 1D array of shape (m,) containing the precomputed sums of the samples.
+    :param col_sqsum: A 1D array of shape (m,) containing the precomputed sums of the squares of the samples.
     :param result: A 1D array of shape (m,) to store the resulting correlation coefficients.
     :type result: cuda.devicearray.DeviceNDArray
     """
     col: int = cuda.grid(1)  # type: ignore
+    tx: int = cuda.threadIdx.x  # type: ignore
+
+    # Threads past the last column still participate in the barriers,
+    # they just do not accumulate or write anything.
+    active = col < samples.shape[1]  # type: ignore
+
+    n = samples.shape[0]
+    product_sum = 0.
+
+    iv_tile = cuda.shared.array(TPB_ROWS, float64)  # type: ignore
+    for row_base in range(0, n, TPB_ROWS):
+        # Strided fill, so the whole tile gets written even when the
+        # block has fewer than TPB_ROWS threads.
+        for idx in range(tx, TPB_ROWS, cuda.blockDim.x):  # type: ignore
+            if row_base + idx < n:
+                iv_tile[idx] = intermediate_values[row_base + idx]
+        cuda.syncthreads()  # type: ignore
+        if active:
+            for row in range(min(TPB_ROWS, n - row_base)):
+                product_sum += samples[row_base + row, col] * iv_tile[row]
+        cuda.syncthreads()  # type: ignore
 
-    if col >= samples.shape[1]:  # type: ignore
+    if not active:
         return
 
+    samples_sum = col_sum[col]
+    samples_sq_sum = col_sqsum[col]
+
+    numerator = float(n) * product_sum - samples_sum * intermed_sum
+    denom_samp = sqrt(float(n) * samples_sq_sum - samples_sum ** 2)
+    denom_int = sqrt(float(n) * intermed_sq_sum - intermed_sum ** 2)
+    denominator = denom_samp * denom_int
+
+    result[col] = numerator / denominator
+
+
+@cuda.jit(cache=True)
+def _gpu_pearson_corr_batched(samples: DeviceNDArray,
+                              intermediate_values: DeviceNDArray,
+                              intermed_sums: DeviceNDArray,
+                              intermed_sq_sums: DeviceNDArray,
+                              col_sum: DeviceNDArray,
+                              col_sqsum: DeviceNDArray,
+                              result: DeviceNDArray):
+    """
+    Calculates the Pearson correlation coefficients between the given samples and a batch of intermediate-value hypotheses.
+
+    Launched on a 2D grid: blocks along the first axis cover the sample
+    columns, the second axis selects the hypothesis. The hypothesis vector
+    is staged into shared memory in tiles of :py:data:`TPB_ROWS` rows.
+
+    :param samples: A 2D array of shape (n, m) containing the samples.
+    :type samples: npt.NDArray[np.number]
+    :param intermediate_values: A 2D array of shape (k, n) containing the intermediate-value hypotheses.
+    :type intermediate_values: npt.NDArray[np.number]
+    :param intermed_sums: A 1D array of shape (k,) containing the precomputed sums of the hypotheses.
+    :param intermed_sq_sums: A 1D array of shape (k,) containing the precomputed sums of the squares of the hypotheses.
+    :param col_sum: A 1D array of shape (m,) containing the precomputed sums of the samples.
+    :param col_sqsum: A 1D array of shape (m,) containing the precomputed sums of the squares of the samples.
+    :param result: A 2D array of shape (k, m) to store the resulting correlation coefficients.
+    :type result: cuda.devicearray.DeviceNDArray
+    """
+    col: int = cuda.blockIdx.x * cuda.blockDim.x + cuda.threadIdx.x  # type: ignore
+    hyp: int = cuda.blockIdx.y  # type: ignore
+    tx: int = cuda.threadIdx.x  # type: ignore
+
+    # Threads past the last column still participate in the barriers,
+    # they just do not accumulate or write anything.
+    active = col < samples.shape[1]  # type: ignore
+
+    n = samples.shape[0]
+    product_sum = 0.
+
+    iv_tile = cuda.shared.array(TPB_ROWS, float64)  # type: ignore
+    for row_base in range(0, n, TPB_ROWS):
+        # Strided fill, so the whole tile gets written even when the
+        # block has fewer than TPB_ROWS threads.
+        for idx in range(tx, TPB_ROWS, cuda.blockDim.x):  # type: ignore
+            if row_base + idx < n:
+                iv_tile[idx] = intermediate_values[hyp, row_base + idx]
+        cuda.syncthreads()  # type: ignore
+        if active:
+            for row in range(min(TPB_ROWS, n - row_base)):
+                product_sum += samples[row_base + row, col] * iv_tile[row]
+        cuda.syncthreads()  # type: ignore
+
+    if not active:
+        return
+
+    samples_sum = col_sum[col]
+    samples_sq_sum = col_sqsum[col]
+
+    numerator = float(n) * product_sum - samples_sum * intermed_sums[hyp]
+    denom_samp = sqrt(float(n) * samples_sq_sum - samples_sum ** 2)
+    denom_int = sqrt(
+        float(n) * intermed_sq_sums[hyp] - intermed_sums[hyp] ** 2)
+    denominator = denom_samp * denom_int
+
+    result[hyp, col] = numerator / denominator
+
+
+@cuda.jit(cache=True)
+def _gpu_pearson_corr_chunked(samples: DeviceNDArray,
+                              intermediate_values: DeviceNDArray,
+                              intermed_sum: float,
+                              intermed_sq_sum: float,
+                              result: DeviceNDArray):
+    """
+    Calculates the Pearson correlation coefficient between the given samples and intermediate values using GPU acceleration.
+
+    Single-pass variant used with chunked processing, where per-sample moments
+    cannot be cached on-device.
+    The intermediate values are staged into shared memory in tiles of
+    :py:data:`TPB_ROWS` rows, so each block reads them from global memory
+    only once instead of once per column.
+
+    :param samples: A 2D array of shape (n, m) containing the samples.
+    :type samples: npt.NDArray[np.number]
+    :param intermediate_values: A 1D array of shape (n,) containing the intermediate values.
+    :type intermediate_values: npt.NDArray[np.number]
+    :param intermed_sum: The precomputed sum of the intermediate values.
+    :param intermed_sq_sum: The precomputed sum of the squares of the intermediate values.
+    :param result: A 1D array of shape (m,) to store the resulting correlation coefficients.
+    :type result: cuda.devicearray.DeviceNDArray
+    """
+    col: int = cuda.grid(1)  # type: ignore
+    tx: int = cuda.threadIdx.x  # type: ignore
+
+    # Threads past the last column still participate in the barriers,
+    # they just do not accumulate or write anything.
+    active = col < samples.shape[1]  # type: ignore
+
     n = samples.shape[0]
     samples_sum = 0.
     samples_sq_sum = 0.
     product_sum = 0.
 
-    for row in range(n):
-        samples_sum += samples[row, col]
-        samples_sq_sum += samples[row, col] ** 2
-        product_sum += samples[row, col] * intermediate_values[row]
+    iv_tile = cuda.shared.array(TPB_ROWS, float64)  # type: ignore
+    for row_base in range(0, n, TPB_ROWS):
+        # Strided fill, so the whole tile gets written even when the
+        # block has fewer than TPB_ROWS threads.
+        for idx in range(tx, TPB_ROWS, cuda.blockDim.x):  # type: ignore
+            if row_base + idx < n:
+                iv_tile[idx] = intermediate_values[row_base + idx]
+        cuda.syncthreads()  # type: ignore
+        if active:
+            for row in range(min(TPB_ROWS, n - row_base)):
+                current = samples[row_base + row, col]
+                samples_sum += current
+                samples_sq_sum += current ** 2
+                product_sum += current * iv_tile[row]
+        cuda.syncthreads()  # type: ignore
+
+    if not active:
+        return
 
-    numerator = float(n) * product_sum - samples_sum * intermed_sum[0]
+    numerator = float(n) * product_sum - samples_sum * intermed_sum
     denom_samp = sqrt(float(n) * samples_sq_sum - samples_sum ** 2)
-    denom_int = sqrt(float(n) * intermed_sq_sum[0] - intermed_sum[0] ** 2)
+    denom_int = sqrt(float(n) * intermed_sq_sum - intermed_sum ** 2)
     denominator = denom_samp * denom_int
 
     result[col] = numerator / denominator
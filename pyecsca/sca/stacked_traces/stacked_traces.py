@@ -30,9 +30,13 @@ class StackedTraces:
             meta = {}
         ts = list(traces)
         min_samples = min(map(len, ts))
+        # Column-major layout so that sample-wise (column) reductions
+        # access contiguous memory. A single preallocated buffer avoids
+        # the per-trace slice views and extra copy of np.stack.
+        stacked = np.empty((len(ts), min_samples), dtype=ts[0].dtype,
+                           order="F")
         for i, t in enumerate(ts):
-            ts[i] = t[:min_samples]
-        stacked = np.stack(ts)
+            stacked[i] = t[:min_samples]
         return cls(stacked, meta)
 
     @classmethod
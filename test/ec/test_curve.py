@@ -122,6 +122,8 @@ def test_affine_multiply(secp128r1, curve25519):
     expected = secp128r1.curve.affine_add(expected, affine_base)
     expected = secp128r1.curve.affine_double(expected)
     assert secp128r1.curve.affine_multiply(affine_base, 10) == expected
+    assert secp128r1.curve.affine_multiply(affine_base, 0) == affine_base
+    assert secp128r1.curve.affine_multiply(affine_base, 1) == affine_base
     assert secp128r1.curve.affine_multiply(secp128r1.curve.neutral, 10) == \
            secp128r1.curve.neutral
     with pytest.raises(ValueError):
@@ -118,6 +118,12 @@ def test_eq():
     assert Mod(1, 7) != Mod(1, 5)
 
 
+def test_is_zero():
+    assert Mod(0, 7).is_zero()
+    assert Mod(7, 7).is_zero()
+    assert not Mod(1, 7).is_zero()
+
+
 def test_pow():
     a = Mod(5, 7)
     assert a ** (-1) == a.inverse()
@@ -12,6 +12,7 @@ from pyecsca.ec.mult import (
     WindowNAFMultiplier,
     SimpleLadderMultiplier,
     DifferentialLadderMultiplier,
+    CombMultiplier,
     CoronMultiplier,
     FixedWindowLTRMultiplier,
     ProcessingDirection,
@@ -261,6 +262,25 @@ def test_fixed_window(secp128r1, add, dbl, width, scale):
     assert InfinityPoint(secp128r1.curve.coordinate_model) == mult.multiply(0)
 
 
+@pytest.mark.parametrize("add,dbl,width,scale",
+                         [
+                             ("add-1998-cmo", "dbl-1998-cmo", 4, "z"),
+                             ("add-2015-rcb", "dbl-2015-rcb", 4, None),
+                             ("add-1998-cmo", "dbl-1998-cmo", 2, None),
+                         ])
+def test_comb(secp128r1, add, dbl, width, scale):
+    formulas = get_formulas(secp128r1.curve.coordinate_model, add, dbl, scale)
+    mult = CombMultiplier(*formulas[:2], width, *formulas[2:])
+    mult.init(secp128r1, secp128r1.generator)
+    res = mult.multiply(157 * 789)
+    other = mult.multiply(157)
+    mult.init(secp128r1, other)
+    other = mult.multiply(789)
+    assert_pt_equality(res, other, scale)
+    mult.init(secp128r1, secp128r1.generator)
+    assert InfinityPoint(secp128r1.curve.coordinate_model) == mult.multiply(0)
+
+
 @pytest.fixture(params=["add-1998-cmo", "add-2015-rcb"])
 def add(secp128r1, request):
     return secp128r1.curve.coordinate_model.formulas[request.param]
@@ -298,8 +318,11 @@ def test_basic_multipliers(secp128r1, num, add, dbl):
                        "recoding_direction": tuple(ProcessingDirection),
                        "accumulation_order": tuple(AccumulationOrder)}
     slides = [SlidingWindowMultiplier(add, dbl, scl=scale, **dict(zip(sliding_options.keys(), combination))) for combination in product(*sliding_options.values())]
+    comb_options = {"width": (2, 4),
+                    "accumulation_order": tuple(AccumulationOrder)}
+    combs = [CombMultiplier(add, dbl, scl=scale, **dict(zip(comb_options.keys(), combination))) for combination in product(*comb_options.values())]
 
-    mults: Sequence[ScalarMultiplier] = ltrs + rtls + bnafs + wnafs + [CoronMultiplier(add, dbl, scale)] + ladders + fixeds + slides
+    mults: Sequence[ScalarMultiplier] = ltrs + rtls + bnafs + wnafs + [CoronMultiplier(add, dbl, scale)] + ladders + fixeds + slides + combs
     results = []
     for mult in mults:
         mult.init(secp128r1, secp128r1.generator)
@@ -24,6 +24,24 @@ def test_construction(secp128r1_coords):
         Point(secp128r1_coords, X=Mod(1, 3), Y=Mod(2, 7), Z=Mod(1, 3))
 
 
+def test_clone(secp128r1, secp128r1_coords):
+    pt = Point(
+        secp128r1_coords,
+        X=Mod(0x161FF7528B899B2D0C28607CA52C5B86, secp128r1.curve.prime),
+        Y=Mod(0xCF5AC8395BAFEB13C02DA292DDED7A83, secp128r1.curve.prime),
+        Z=Mod(1, secp128r1.curve.prime),
+    )
+    cloned = pt.clone()
+    assert cloned == pt
+    assert cloned is not pt
+    assert cloned.coords is not pt.coords
+
+    infty = InfinityPoint(secp128r1_coords)
+    cloned_infty = infty.clone()
+    assert isinstance(cloned_infty, InfinityPoint)
+    assert cloned_infty == infty
+
+
 def test_to_affine(secp128r1, secp128r1_coords, affine_model):
     pt = Point(
         secp128r1_coords,
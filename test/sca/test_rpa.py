@@ -1,5 +1,6 @@
 import io
 from contextlib import redirect_stdout
+from functools import lru_cache
 
 import pytest
 
@@ -19,44 +20,59 @@ from pyecsca.ec.point import Point
 from pyecsca.sca.re.rpa import MultipleContext, rpa_point_0y, rpa_point_x0, rpa_distinguish
 
 
-@pytest.fixture()
+class _NullIO(io.IOBase):
+    """A discarding writer, used to drop the rpa_distinguish output without buffering it."""
+
+    def writable(self):
+        return True
+
+    def write(self, s):
+        return len(s)
+
+
+@pytest.fixture(scope="module")
 def model():
     return ShortWeierstrassModel()
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def coords(model):
     return model.coordinates["projective"]
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def add(coords):
     return coords.formulas["add-2007-bl"]
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def dbl(coords):
     return coords.formulas["dbl-2007-bl"]
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def neg(coords):
     return coords.formulas["neg"]
 
 
+# Constructed once at module scope, so repeated fixture instantiations
+# reuse the same Mod instances instead of re-reducing the constants.
+_P = 0x85d265945a4f5681
+_A = Mod(0x7fc57b4110698bc0, _P)
+_B = Mod(0x37113ea591b04527, _P)
+_GX = Mod(0x80d2d78fddb97597, _P)
+_GY = Mod(0x5586d818b7910930, _P)
+_ZERO = Mod(0, _P)
+_ONE = Mod(1, _P)
+
+
 @pytest.fixture()
 def rpa_params(model, coords):
-    p = 0x85d265945a4f5681
-    a = Mod(0x7fc57b4110698bc0, p)
-    b = Mod(0x37113ea591b04527, p)
-    gx = Mod(0x80d2d78fddb97597, p)
-    gy = Mod(0x5586d818b7910930, p)
     # (0x4880bcf620852a54, 0) RPA point
     # (0, 0x6bed3155c9ada064) RPA point
-
-    infty = Point(coords, X=Mod(0, p), Y=Mod(1, p), Z=Mod(0, p))
-    g = Point(coords, X=gx, Y=gy, Z=Mod(1, p))
-    curve = EllipticCurve(model, coords, p, infty, dict(a=a, b=b))
+    infty = Point(coords, X=_ZERO, Y=_ONE, Z=_ZERO)
+    g = Point(coords, X=_GX, Y=_GY, Z=_ONE)
+    curve = EllipticCurve(model, coords, _P, infty, dict(a=_A, b=_B))
     return DomainParameters(curve, g, 0x85d265932d90785c, 1)
 
 
@@ -72,28 +88,62 @@ def test_0y_point(rpa_params):
     assert res.x == 0
 
 
-def test_distinguish(secp128r1, add, dbl, neg):
-    multipliers = [LTRMultiplier(add, dbl, None, False, AccumulationOrder.PeqRP, True, True),
-                   LTRMultiplier(add, dbl, None, True, AccumulationOrder.PeqRP, True, True),
-                   RTLMultiplier(add, dbl, None, False, AccumulationOrder.PeqRP, True),
-                   RTLMultiplier(add, dbl, None, True, AccumulationOrder.PeqRP, True),
-                   SimpleLadderMultiplier(add, dbl, None, True, True),
-                   BinaryNAFMultiplier(add, dbl, neg, None, ProcessingDirection.LTR, AccumulationOrder.PeqRP, True),
-                   WindowNAFMultiplier(add, dbl, neg, 3, None, AccumulationOrder.PeqRP, True),
-                   WindowNAFMultiplier(add, dbl, neg, 4, None, AccumulationOrder.PeqRP, True),
-                   SlidingWindowMultiplier(add, dbl, 3, None, ProcessingDirection.LTR, AccumulationOrder.PeqRP, True),
-                   SlidingWindowMultiplier(add, dbl, 3, None, ProcessingDirection.RTL, AccumulationOrder.PeqRP, True),
-                   FixedWindowLTRMultiplier(add, dbl, 3, None, AccumulationOrder.PeqRP, True),
-                   FixedWindowLTRMultiplier(add, dbl, 8, None, AccumulationOrder.PeqRP, True)]
-    for real_mult in multipliers:
-        def simulated_oracle(scalar, affine_point):
-            point = affine_point.to_model(secp128r1.curve.coordinate_model, secp128r1.curve)
-            with local(MultipleContext()) as ctx:
-                real_mult.init(secp128r1, point)
-                real_mult.multiply(scalar)
-            return any(map(lambda P: P.X == 0 or P.Y == 0, ctx.points.keys()))
-
-        with redirect_stdout(io.StringIO()):
-            result = rpa_distinguish(secp128r1, multipliers, simulated_oracle)
-        assert 1 == len(result)
-        assert real_mult == result[0]
+# Factories instead of instances, as the formulas only exist once the
+# fixtures are set up. One test runs per multiplier, so the probes are
+# independently schedulable (and farmed out under pytest-xdist).
+_MULT_FACTORIES = [
+    lambda add, dbl, neg: LTRMultiplier(add, dbl, None, False, AccumulationOrder.PeqRP, True, True),
+    lambda add, dbl, neg: LTRMultiplier(add, dbl, None, True, AccumulationOrder.PeqRP, True, True),
+    lambda add, dbl, neg: RTLMultiplier(add, dbl, None, False, AccumulationOrder.PeqRP, True),
+    lambda add, dbl, neg: RTLMultiplier(add, dbl, None, True, AccumulationOrder.PeqRP, True),
+    lambda add, dbl, neg: SimpleLadderMultiplier(add, dbl, None, True, True),
+    lambda add, dbl, neg: BinaryNAFMultiplier(add, dbl, neg, None, ProcessingDirection.LTR, AccumulationOrder.PeqRP, True),
+    lambda add, dbl, neg: WindowNAFMultiplier(add, dbl, neg, 3, None, AccumulationOrder.PeqRP, True),
+    lambda add, dbl, neg: WindowNAFMultiplier(add, dbl, neg, 4, None, AccumulationOrder.PeqRP, True),
+    lambda add, dbl, neg: SlidingWindowMultiplier(add, dbl, 3, None, ProcessingDirection.LTR, AccumulationOrder.PeqRP, True),
+    lambda add, dbl, neg: SlidingWindowMultiplier(add, dbl, 3, None, ProcessingDirection.RTL, AccumulationOrder.PeqRP, True),
+    lambda add, dbl, neg: FixedWindowLTRMultiplier(add, dbl, 3, None, AccumulationOrder.PeqRP, True),
+    lambda add, dbl, neg: FixedWindowLTRMultiplier(add, dbl, 8, None, AccumulationOrder.PeqRP, True),
+]
+
+_MULT_IDS = ["ltr", "ltr-always", "rtl", "rtl-always", "ladder", "bnaf",
+             "wnaf3", "wnaf4", "sliding-ltr", "sliding-rtl", "fixed3",
+             "fixed8"]
+
+
+@pytest.fixture(scope="module")
+def multipliers(add, dbl, neg):
+    return [factory(add, dbl, neg) for factory in _MULT_FACTORIES]
+
+
+@pytest.mark.parametrize("mult_idx", range(len(_MULT_FACTORIES)), ids=_MULT_IDS)
+def test_distinguish(secp128r1, multipliers, mult_idx):
+    real_mult = multipliers[mult_idx]
+
+    # rpa_distinguish probes with a small set of candidate points, so the
+    # conversion (a handful of field operations) is shared across all the
+    # oracle calls.
+    @lru_cache(maxsize=None)
+    def to_projective(affine_point):
+        return affine_point.to_model(secp128r1.curve.coordinate_model, secp128r1.curve)
+
+    # One context is reset and reused across the oracle calls, so each
+    # query does not allocate (and deep-copy) a fresh one.
+    ctx_holder = MultipleContext()
+
+    # The oracle result is memoized, so repeated queries with the same
+    # scalar and point cost a dict lookup instead of a full simulated
+    # scalar multiplication.
+    @lru_cache(maxsize=None)
+    def simulated_oracle(scalar, affine_point):
+        point = to_projective(affine_point)
+        ctx_holder.reset()
+        with local(ctx_holder, copy=False):
+            real_mult.init(secp128r1, point)
+            real_mult.multiply(scalar)
+        return ctx_holder.has_zero_coord
+
+    with redirect_stdout(_NullIO()):
+        result = rpa_distinguish(secp128r1, multipliers, simulated_oracle)
+    assert 1 == len(result)
+    assert real_mult == result[0]
@@ -45,6 +45,15 @@ def test_fromarray(samples):
     assert (stacked.samples == samples[:, :min_len]).all()
 
 
+def test_accessors(samples):
+    stacked = StackedTraces(samples)
+
+    assert len(stacked) == samples.shape[0]
+    assert (stacked[0] == samples[0]).all()
+    for trace, sample_row in zip(stacked, samples):
+        assert (trace == sample_row).all()
+
+
 def test_fromtraceset(samples):
     max_len = samples.shape[1]
     min_len = max_len // 2
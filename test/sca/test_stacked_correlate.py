@@ -34,6 +34,12 @@ def intermediate_values():
     return np.random.rand(TRACE_COUNT)
 
 
+@pytest.fixture()
+def intermediate_values_batch():
+    np.random.seed(0x5678)
+    return np.random.rand(8, TRACE_COUNT)
+
+
 def pearson_corr(samples, intermediate_values):
     return np.corrcoef(samples, intermediate_values, rowvar=False)[-1, :-1]
 
@@ -50,6 +56,20 @@ def test_pearson_coef_no_chunking(samples, gpu_manager, intermediate_values):
     assert all(np.isclose(corr_gpu.samples, corr_cmp, rtol=RTOL, atol=ATOL))
 
 
+def test_pearson_coef_batched(samples, gpu_manager, intermediate_values_batch):
+    corr_gpu = gpu_pearson_corr(intermediate_values_batch,
+                                trace_manager=gpu_manager)
+
+    assert isinstance(corr_gpu, list)
+    assert len(corr_gpu) == intermediate_values_batch.shape[0]
+    for corr_trace, iv in zip(corr_gpu, intermediate_values_batch):
+        corr_cmp = pearson_corr(samples, iv)
+        assert isinstance(corr_trace, CombinedTrace)
+        assert corr_trace.samples.shape == corr_cmp.shape
+        assert all(np.isclose(corr_trace.samples, corr_cmp,
+                              rtol=RTOL, atol=ATOL))
+
+
 def test_pearson_coef_chunking(samples, gpu_manager, intermediate_values):
     corr_gpu = gpu_pearson_corr(intermediate_values,
                                 trace_manager=gpu_manager,